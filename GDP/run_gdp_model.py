@@ -2,103 +2,285 @@
 สคริปต์สำหรับรันโมเดล GDP โดยไม่แสดงกราฟบนหน้าจอ (บันทึกเป็นไฟล์เท่านั้น)
 """
 
+import argparse
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # ใช้ backend ที่ไม่แสดงกราฟบนหน้าจอ
-import matplotlib.pyplot as plt
 import pandas as pd
 
-# ตั้งค่าให้ matplotlib รองรับภาษาไทย
-plt.rcParams['font.family'] = 'Arial Unicode MS'
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+# ดัชนีคอลัมน์ของ GDPModel._arr (structure-of-arrays หนึ่งคอลัมน์ต่อองค์ประกอบ)
+C, I, G, X, M, GDP = range(6)
+ARRAY_COLUMNS = ['Consumption', 'Investment', 'Government_Spending', 'Exports', 'Imports', 'GDP']
+# ข้อมูลเป็นหลักพันล้านที่มีเลขนัยสำคัญไม่เกิน 6 หลัก float32 (ความคลาดเคลื่อนสัมพัทธ์ราว 1e-7)
+# จึงเพียงพอ และใช้หน่วยความจำครึ่งหนึ่งของ float64
+ARRAY_DTYPE = np.float32
+
+# องค์ประกอบของ stacked bar chart: (คอลัมน์, ชื่อในคำอธิบาย, สี)
+GDP_STACK_COMPONENTS = [
+    ('Consumption', 'Consumption / การบริโภค', '#A23B72'),
+    ('Investment', 'Investment / การลงทุน', '#F18F01'),
+    ('Government_Spending', 'Government Spending / การใช้จ่ายรัฐ', '#C73E1D'),
+    ('Net_Exports', 'Net Exports / การส่งออกสุทธิ', '#6A994E')
+]
+
+# องค์ประกอบของกราฟแนวโน้มรายองค์ประกอบ: (คอลัมน์, ชื่อภาษาไทย, สี) เรียงตาม ARRAY_COLUMNS
+GDP_TREND_COMPONENTS = [
+    ('Consumption', 'การบริโภค', '#A23B72'),
+    ('Investment', 'การลงทุน', '#F18F01'),
+    ('Government_Spending', 'การใช้จ่ายรัฐ', '#C73E1D'),
+    ('Exports', 'การส่งออก', '#2E86AB'),
+    ('Imports', 'การนำเข้า', '#E63946'),
+    ('GDP', 'GDP', '#06A77D')
+]
+
+# ตัวเลือกของ Pillow ตามนามสกุลไฟล์ที่บันทึก: PNG ใช้ zlib ระดับต่ำสุดที่ยังบีบอัด
+# ส่วน WebP แบบ lossless ใช้ method 0 ซึ่งเร็วที่สุด
+_PIL_KWARGS = {
+    '.png': {'compress_level': 1, 'optimize': False},
+    '.webp': {'lossless': True, 'method': 0}
+}
+
+
+# dtype ที่ kernel ของ GDP มี signature รองรับ ชนิดอื่น (เช่น int) คำนวณด้วยตัวดำเนินการปกติเพื่อคงชนิดผลลัพธ์เดิม
+_KERNEL_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+# (gdp_kernel, growth_rate) ที่สร้างโดย _load_kernels เมื่อถูกใช้ครั้งแรก
+_kernels = None
+
+
+def _gdp_elementwise(c, i, g, x, m):
+    """C + I + G + (X - M) ทีละสมาชิก ต้นแบบของ ufunc ที่รวมทุกการบวกลบไว้ในรอบเดียว"""
+    return c + i + g + x - m
+
+
+def _growth_rate_loop(gdp):
+    """อัตราการเติบโตรายปี (%) ของ gdp โดยปีแรกเป็น NaN เขียนเป็นลูปสำหรับคอมไพล์ด้วย numba"""
+    out = np.empty_like(gdp)
+    if gdp.size:
+        out[0] = np.nan
+    for i in range(1, gdp.size):
+        out[i] = (gdp[i] / gdp[i - 1] - 1.0) * 100
+    return out
+
+
+def _growth_rate_numpy(gdp):
+    """อัตราการเติบโตรายปี (%) ของ gdp โดยปีแรกเป็น NaN"""
+    out = np.empty_like(gdp)
+    out[:1] = np.nan
+    out[1:] = (gdp[1:] / gdp[:-1] - 1.0) * 100
+    return out
+
+
+def _load_kernels():
+    """คืน (gdp_kernel, growth_rate) โดย import numba และคอมไพล์ในครั้งแรกที่ถูกเรียก"""
+    global _kernels
+    if _kernels is None:
+        try:
+            import numba
+        except ImportError:  # numba เป็น dependency เสริม ถ้าไม่มีจะคำนวณด้วย NumPy ตามปกติ
+            _kernels = (None, _growth_rate_numpy)
+        else:
+            gdp_kernel = numba.vectorize(['f4(f4,f4,f4,f4,f4)', 'f8(f8,f8,f8,f8,f8)'],
+                                         nopython=True, target='cpu', cache=True)(_gdp_elementwise)
+            _kernels = (gdp_kernel, numba.njit(cache=True)(_growth_rate_loop))
+    return _kernels
+
+
+def _growth_rate(gdp):
+    """อัตราการเติบโตรายปี (%) ของ gdp โดยปีแรกเป็น NaN"""
+    return _load_kernels()[1](gdp)
+
+
+def _set_bar_data(bars, x, heights, bottoms=None):
+    """อัปเดตตำแหน่งและความสูงของแท่งใน BarContainer ที่มีอยู่แล้ว"""
+    if bottoms is None:
+        bottoms = np.zeros(len(heights))
+    for rect, xi, height, bottom in zip(bars, x, heights, bottoms):
+        rect.set_x(xi - rect.get_width() / 2)
+        rect.set_y(bottom)
+        rect.set_height(height)
+    # bar_label ใช้ datavalues ตัดสินว่าจะวางป้ายด้านบนหรือด้านล่างของแท่ง
+    bars.datavalues = np.asarray(heights)
 
 
 class GDPModel:
     """โมเดลสำหรับคำนวณ GDP"""
     
-    def __init__(self):
-        self.data = None
+    _styled = False
+    
+    def __init__(self, dpi=150, reuse_figures=False):
+        self.dpi = dpi  # ความละเอียดของไฟล์กราฟที่บันทึก
+        # เก็บรูปและ artist ไว้ใช้ซ้ำเมื่อวาดกราฟเดิมอีกครั้ง (สำหรับโมเดลที่วาดซ้ำหลายรอบ)
+        # รูปที่เก็บไว้จะอยู่ในหน่วยความจำตลอดอายุของโมเดล แม้จะปิดจาก pyplot แล้วก็ตาม
+        self.reuse_figures = reuse_figures
+        self._years = None
+        self._arr = None
+        self._growth_cache = None
         self.gdp_values = None
+        self._figures = {}
+    
+    @property
+    def data(self):
+        """DataFrame สำหรับแสดงผล สร้างจาก self._arr ทุกครั้ง (อ่านอย่างเดียว แก้ข้อมูลด้วย model.data = df)"""
+        if self._arr is None:
+            return None
+        net_exports = self._arr[:, X] - self._arr[:, M]
+        net_exports.flags.writeable = False
+        columns = {'Year': self._years}
+        columns.update((name, self._arr[:, k]) for k, name in enumerate(ARRAY_COLUMNS))
+        columns['Net_Exports'] = net_exports
+        return pd.DataFrame(columns, copy=False)
+    
+    @data.setter
+    def data(self, frame):
+        """กำหนดข้อมูลจาก DataFrame ที่มีคอลัมน์ Year และ ARRAY_COLUMNS"""
+        if frame is None:
+            self._set_arrays(None, None)
+        else:
+            # คัดลอกเสมอ เพื่อไม่ให้การแก้ไข frame ภายหลังย้อนมาเปลี่ยนข้อมูลของโมเดล
+            self._set_arrays(frame['Year'].to_numpy(dtype=np.int64, copy=True),
+                             frame[ARRAY_COLUMNS].to_numpy(dtype=ARRAY_DTYPE, copy=True))
+    
+    def _set_arrays(self, years, arr):
+        """กำหนด self._years และ self._arr แบบอ่านอย่างเดียว และล้างค่าที่คำนวณเก็บไว้"""
+        for a in (years, arr):
+            if a is not None:
+                a.flags.writeable = False
+        self._years = years
+        self._arr = arr
+        self._growth_cache = None
     
     def calculate_gdp(self, consumption, investment, government_spending, exports, imports):
         """คำนวณ GDP จากสูตร GDP = C + I + G + (X - M)"""
+        args = (consumption, investment, government_spending, exports, imports)
+        if all(isinstance(a, np.ndarray) and a.dtype in _KERNEL_DTYPES for a in args):
+            gdp_kernel = _load_kernels()[0]
+            if gdp_kernel is not None:
+                return gdp_kernel(*args)
+        
         net_exports = exports - imports
         gdp = consumption + investment + government_spending + net_exports
         return gdp
     
     def generate_sample_data(self, years=10, start_year=2015):
         """สร้างข้อมูลตัวอย่างสำหรับการคำนวณ GDP"""
-        np.random.seed(42)
-        
-        years_list = list(range(start_year, start_year + years))
-        
-        base_consumption = 5000
-        base_investment = 1500
-        base_gov_spending = 2000
-        base_exports = 1800
-        base_imports = 1600
-        
-        data = {
-            'Year': years_list,
-            'Consumption': [base_consumption + i*200 + np.random.normal(0, 100) for i in range(years)],
-            'Investment': [base_investment + i*80 + np.random.normal(0, 50) for i in range(years)],
-            'Government_Spending': [base_gov_spending + i*100 + np.random.normal(0, 60) for i in range(years)],
-            'Exports': [base_exports + i*90 + np.random.normal(0, 70) for i in range(years)],
-            'Imports': [base_imports + i*85 + np.random.normal(0, 65) for i in range(years)]
-        }
-        
-        self.data = pd.DataFrame(data)
-        self.data['GDP'] = self.calculate_gdp(
-            self.data['Consumption'],
-            self.data['Investment'],
-            self.data['Government_Spending'],
-            self.data['Exports'],
-            self.data['Imports']
-        )
-        self.data['Net_Exports'] = self.data['Exports'] - self.data['Imports']
-        
-        return self.data
+        # ระบุ PCG64 ตรงๆ เพื่อให้ผลสุ่มคงที่แม้ค่า default ของ NumPy จะเปลี่ยน
+        rng = np.random.Generator(np.random.PCG64(42))
+        
+        # ค่าฐาน แนวโน้มต่อปี และส่วนเบี่ยงเบนมาตรฐาน ของ C, I, G, X, M ตามลำดับ
+        bases = np.array([5000, 1500, 2000, 1800, 1600], dtype=ARRAY_DTYPE)
+        slopes = np.array([200, 80, 100, 90, 85], dtype=ARRAY_DTYPE)
+        stds = np.array([100, 50, 60, 70, 65], dtype=ARRAY_DTYPE)
+        
+        # สุ่มค่าทั้งหมดในครั้งเดียว แทนการเรียก np.random.normal ทีละค่า
+        idx = np.arange(years, dtype=ARRAY_DTYPE)
+        arr = np.empty((years, len(ARRAY_COLUMNS)), dtype=ARRAY_DTYPE)
+        arr[:, :GDP] = (bases + np.outer(idx, slopes)
+                        + rng.standard_normal((years, 5), dtype=ARRAY_DTYPE) * stds)
+        
+        # คำนวณ GDP บน ndarray โดยตรง DataFrame จะถูกสร้างเมื่อมีการเรียกใช้ self.data เท่านั้น
+        arr[:, GDP] = self.calculate_gdp(arr[:, C], arr[:, I], arr[:, G], arr[:, X], arr[:, M])
+        
+        self._set_arrays(np.arange(start_year, start_year + years, dtype=np.int64), arr)
+        
+        # คืนสำเนาที่ผู้เรียกแก้ไขได้เหมือนเดิม ส่วน self.data ยังเป็นมุมมองแบบอ่านอย่างเดียว
+        return self.data.copy()
+    
+    def _growth(self):
+        """อัตราการเติบโตของ GDP รายปี (%) คำนวณครั้งเดียวแล้วเก็บไว้จนกว่าข้อมูลจะเปลี่ยน"""
+        # เก็บคู่ (อาร์เรย์ต้นทาง, ผลลัพธ์) ถ้า self._arr ถูกแทนที่ด้วยอาร์เรย์อื่น ค่าเดิมจะไม่ถูกใช้อีก
+        # ส่วนการแก้ค่าในตำแหน่งเดิมทำไม่ได้เพราะ self._arr เป็นแบบอ่านอย่างเดียว
+        cached = self._growth_cache
+        if cached is None or cached[0] is not self._arr:
+            growth = _growth_rate(self._arr[:, GDP])
+            growth.flags.writeable = False
+            cached = self._growth_cache = (self._arr, growth)
+        return cached[1]
+    
+    @classmethod
+    def _ensure_style(cls):
+        """ตั้งค่า rcParams ของ matplotlib เพียงครั้งเดียวเมื่อมีการวาดกราฟครั้งแรก"""
+        if cls._styled:
+            return
+        import matplotlib
+        matplotlib.use('Agg')  # ใช้ backend ที่ไม่แสดงกราฟบนหน้าจอ
+        import matplotlib.pyplot as plt
+        
+        # ตั้งค่าให้ matplotlib รองรับภาษาไทย
+        plt.rcParams['font.family'] = 'Arial Unicode MS'
+        plt.rcParams['figure.figsize'] = (12, 8)
+        plt.rcParams['font.size'] = 10
+        cls._styled = True
+    
+    def _get_or_create_fig(self, key, build):
+        """
+        คืน (fig, artists) ของกราฟ key โดยเรียก build(n) สร้างรูปเฉพาะครั้งแรก
+        หรือเมื่อจำนวนปีเปลี่ยน ถ้า reuse_figures เป็น True ครั้งถัดไปจะใช้ artist เดิมแล้วอัปเดตข้อมูล
+        """
+        import matplotlib.pyplot as plt
+        
+        n = len(self._years)
+        cached = self._figures.get(key)
+        if cached is None or cached[2] != n:
+            if cached is not None:
+                plt.close(cached[0])
+            fig, artists = build(n)
+            cached = self._figures[key] = (fig, artists, n)
+        return cached[0], cached[1]
+    
+    def _build_gdp_trend(self, n):
+        """สร้างรูปและ artist ของกราฟแนวโน้ม GDP"""
+        import matplotlib.pyplot as plt
+        
+        fig, ax = plt.subplots(figsize=(12, 6))
+        line, = ax.plot([], [], marker='o', linewidth=2, 
+                        markersize=8, color='#2E86AB', label='GDP')
+        
+        ax.set_title('GDP Trend Over Time / แนวโน้ม GDP ตามช่วงเวลา', fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel('Year / ปี', fontsize=12, fontweight='bold')
+        ax.set_ylabel('GDP (Billion) / GDP (พันล้าน)', fontsize=12, fontweight='bold')
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.legend(fontsize=11)
+        
+        return fig, {'ax': ax, 'line': line, 'labels': []}
     
     def plot_gdp_trend(self, save_path='gdp_trend.png'):
         """แสดงกราฟแนวโน้ม GDP"""
-        plt.figure(figsize=(12, 6))
-        plt.plot(self.data['Year'], self.data['GDP'], marker='o', linewidth=2, 
-                markersize=8, color='#2E86AB', label='GDP')
-        
-        plt.title('GDP Trend Over Time / แนวโน้ม GDP ตามช่วงเวลา', fontsize=16, fontweight='bold', pad=20)
-        plt.xlabel('Year / ปี', fontsize=12, fontweight='bold')
-        plt.ylabel('GDP (Billion) / GDP (พันล้าน)', fontsize=12, fontweight='bold')
-        plt.grid(True, alpha=0.3, linestyle='--')
-        plt.legend(fontsize=11)
-        
-        for i, row in self.data.iterrows():
-            plt.annotate(f'{row["GDP"]:.0f}', 
-                        xy=(row['Year'], row['GDP']),
+        self._ensure_style()
+        fig, artists = self._get_or_create_fig('trend', self._build_gdp_trend)
+        ax = artists['ax']
+        
+        years = self._years
+        gdp = self._arr[:, GDP]
+        artists['line'].set_data(years, gdp)
+        
+        # เพิ่มค่าบนจุดข้อมูล
+        for text in artists['labels']:
+            text.remove()
+        artists['labels'] = [
+            ax.annotate(f'{value:.0f}', 
+                        xy=(year, value),
                         xytext=(0, 10), textcoords='offset points',
                         ha='center', fontsize=9, alpha=0.7)
+            for year, value in zip(years.tolist(), gdp.tolist())
+        ]
         
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ บันทึกกราฟที่: {save_path}")
+        self._render(fig, [ax], save_path)
     
-    def plot_gdp_components(self, save_path='gdp_components.png'):
-        """แสดงกราฟองค์ประกอบของ GDP"""
+    def _build_gdp_components(self, n):
+        """สร้างรูปและ artist ของกราฟองค์ประกอบของ GDP"""
+        import matplotlib.pyplot as plt
+        
         fig, ax = plt.subplots(figsize=(14, 8))
         
-        years = self.data['Year']
         width = 0.6
-        
-        p1 = ax.bar(years, self.data['Consumption'], width, label='Consumption / การบริโภค', color='#A23B72')
-        p2 = ax.bar(years, self.data['Investment'], width, bottom=self.data['Consumption'],
-                   label='Investment / การลงทุน', color='#F18F01')
-        p3 = ax.bar(years, self.data['Government_Spending'], width,
-                   bottom=self.data['Consumption'] + self.data['Investment'],
-                   label='Government Spending / การใช้จ่ายรัฐ', color='#C73E1D')
-        p4 = ax.bar(years, self.data['Net_Exports'], width,
-                   bottom=self.data['Consumption'] + self.data['Investment'] + self.data['Government_Spending'],
-                   label='Net Exports / การส่งออกสุทธิ', color='#6A994E')
+        # สร้าง stacked bar chart โดยเริ่มจากแท่งสูง 0 แล้วค่อยใส่ข้อมูลจริงตอนวาด
+        bars = [
+            ax.bar(np.arange(n), np.zeros(n), width, label=label, color=color)
+            for _, label, color in GDP_STACK_COMPONENTS
+        ]
         
         ax.set_title('GDP Components / องค์ประกอบของ GDP', fontsize=16, fontweight='bold', pad=20)
         ax.set_xlabel('Year / ปี', fontsize=12, fontweight='bold')
@@ -106,120 +288,238 @@ class GDPModel:
         ax.legend(loc='upper left', fontsize=10)
         ax.grid(True, alpha=0.3, axis='y', linestyle='--')
         
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ บันทึกกราฟที่: {save_path}")
+        return fig, {'ax': ax, 'bars': bars}
+    
+    def plot_gdp_components(self, save_path='gdp_components.png'):
+        """แสดงกราฟองค์ประกอบของ GDP"""
+        self._ensure_style()
+        fig, artists = self._get_or_create_fig('components', self._build_gdp_components)
+        
+        years = self._years
+        arr = self._arr
+        
+        # ผลรวมสะสมคำนวณครั้งเดียว แถวที่ k คือฐานของแท่งชั้นที่ k (เรียงตาม GDP_STACK_COMPONENTS)
+        stack = np.stack([arr[:, C], arr[:, I], arr[:, G], arr[:, X] - arr[:, M]])
+        bottoms = np.vstack([np.zeros(len(years)), np.cumsum(stack[:-1], axis=0)])
+        
+        for k, bars in enumerate(artists['bars']):
+            _set_bar_data(bars, years, stack[k], bottoms[k])
+        
+        self._render(fig, [artists['ax']], save_path)
+    
+    def _build_growth_rate(self, n):
+        """สร้างรูปและ artist ของกราฟอัตราการเติบโตของ GDP"""
+        import matplotlib.pyplot as plt
+        
+        fig, ax = plt.subplots(figsize=(12, 6))
+        bars = ax.bar(np.arange(n - 1), np.zeros(n - 1), alpha=0.7, edgecolor='black')
+        
+        ax.set_title('GDP Growth Rate / อัตราการเติบโตของ GDP', fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel('Year / ปี', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Growth Rate (%) / อัตราการเติบโต (%)', fontsize=12, fontweight='bold')
+        ax.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
+        ax.grid(True, alpha=0.3, axis='y', linestyle='--')
+        
+        return fig, {'ax': ax, 'bars': bars, 'labels': []}
     
     def plot_growth_rate(self, save_path='gdp_growth_rate.png'):
         """แสดงกราฟอัตราการเติบโตของ GDP"""
-        growth_rate = self.data['GDP'].pct_change() * 100
-        
-        plt.figure(figsize=(12, 6))
-        colors = ['#06A77D' if x >= 0 else '#D62828' for x in growth_rate[1:]]
-        plt.bar(self.data['Year'][1:], growth_rate[1:], color=colors, alpha=0.7, edgecolor='black')
-        
-        plt.title('GDP Growth Rate / อัตราการเติบโตของ GDP', fontsize=16, fontweight='bold', pad=20)
-        plt.xlabel('Year / ปี', fontsize=12, fontweight='bold')
-        plt.ylabel('Growth Rate (%) / อัตราการเติบโต (%)', fontsize=12, fontweight='bold')
-        plt.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
-        plt.grid(True, alpha=0.3, axis='y', linestyle='--')
-        
-        for i, (year, rate) in enumerate(zip(self.data['Year'][1:], growth_rate[1:])):
-            plt.annotate(f'{rate:.1f}%', 
-                        xy=(year, rate),
-                        xytext=(0, 5 if rate >= 0 else -15), 
-                        textcoords='offset points',
-                        ha='center', fontsize=9, fontweight='bold')
-        
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ บันทึกกราฟที่: {save_path}")
+        self._ensure_style()
+        
+        # คำนวณอัตราการเติบโต
+        growth_rate = self._growth()[1:]
+        
+        fig, artists = self._get_or_create_fig('growth', self._build_growth_rate)
+        ax = artists['ax']
+        
+        colors = np.where(growth_rate >= 0, '#06A77D', '#D62828')
+        _set_bar_data(artists['bars'], self._years[1:], growth_rate)
+        for rect, color in zip(artists['bars'], colors):
+            rect.set_facecolor(color)
+        
+        # เพิ่มค่าบนแท่ง (bar_label วางป้ายไว้ใต้แท่งที่ติดลบให้เอง)
+        for text in artists['labels']:
+            text.remove()
+        labels = [f'{rate:.1f}%' for rate in growth_rate.tolist()]
+        artists['labels'] = ax.bar_label(artists['bars'], labels=labels, padding=3,
+                                         fontsize=9, fontweight='bold')
+        
+        self._render(fig, [ax], save_path)
     
-    def plot_all_components_trends(self, save_path='all_components_trends.png'):
-        """แสดงกราฟแนวโน้มของทุกองค์ประกอบ"""
+    def _build_all_components_trends(self, n):
+        """สร้างรูปและ artist ของกราฟแนวโน้มทุกองค์ประกอบ"""
+        import matplotlib.pyplot as plt
+        
         fig, axes = plt.subplots(2, 3, figsize=(16, 10))
         fig.suptitle('GDP Components Trends / แนวโน้มองค์ประกอบของ GDP', 
                     fontsize=18, fontweight='bold', y=0.995)
         
-        components = [
-            ('Consumption', 'การบริโภค', '#A23B72'),
-            ('Investment', 'การลงทุน', '#F18F01'),
-            ('Government_Spending', 'การใช้จ่ายรัฐ', '#C73E1D'),
-            ('Exports', 'การส่งออก', '#2E86AB'),
-            ('Imports', 'การนำเข้า', '#E63946'),
-            ('GDP', 'GDP', '#06A77D')
-        ]
-        
-        for idx, (component, thai_name, color) in enumerate(components):
+        lines = []
+        for idx, (component, thai_name, color) in enumerate(GDP_TREND_COMPONENTS):
             row = idx // 3
             col = idx % 3
             ax = axes[row, col]
             
-            ax.plot(self.data['Year'], self.data[component], 
-                   marker='o', linewidth=2, markersize=6, color=color)
+            line, = ax.plot([], [], marker='o', linewidth=2, markersize=6, color=color)
+            lines.append(line)
             ax.set_title(f'{component} / {thai_name}', fontsize=12, fontweight='bold')
             ax.set_xlabel('Year / ปี', fontsize=10)
             ax.set_ylabel('Value (Billion) / มูลค่า', fontsize=10)
             ax.grid(True, alpha=0.3, linestyle='--')
         
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        return fig, {'axes': axes.ravel().tolist(), 'lines': lines}
+    
+    def plot_all_components_trends(self, save_path='all_components_trends.png'):
+        """แสดงกราฟแนวโน้มของทุกองค์ประกอบ"""
+        self._ensure_style()
+        fig, artists = self._get_or_create_fig('all_components', self._build_all_components_trends)
+        
+        for k, line in enumerate(artists['lines']):
+            line.set_data(self._years, self._arr[:, k])
+        
+        self._render(fig, artists['axes'], save_path)
+    
+    def _render(self, fig, axes, save_path):
+        """ปรับขอบเขตแกนตามข้อมูลใหม่ บันทึกรูปเป็นไฟล์ แล้วปิดรูป (และลบออกจาก cache ถ้าไม่ reuse_figures)"""
+        import matplotlib.pyplot as plt
+        
+        for ax in axes:
+            ax.relim()
+            ax.autoscale_view()
+        
+        fig.tight_layout()
+        pil_kwargs = _PIL_KWARGS.get(os.path.splitext(save_path)[1].lower())
+        extra = {'pil_kwargs': pil_kwargs} if pil_kwargs else {}
+        fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight', **extra)
         print(f"✓ บันทึกกราฟที่: {save_path}")
+        plt.close(fig)
+        if not self.reuse_figures:
+            # ลบออกจาก cache ด้วย มิฉะนั้น self._figures จะอ้างอิงรูปที่ปิดแล้วไว้ตลอดอายุของโมเดล
+            self._figures = {key: entry for key, entry in self._figures.items() if entry[0] is not fig}
+    
+    def _format_table(self):
+        """จัดรูปแบบตารางข้อมูลรายปีจาก self._arr โดยตรงแทน DataFrame.to_string"""
+        arr = self._arr
+        headers = ['Year'] + ARRAY_COLUMNS + ['Net_Exports']
+        columns = [self._years] + [arr[:, k] for k in range(len(ARRAY_COLUMNS))] + [arr[:, X] - arr[:, M]]
+        specs = ['d'] + ['.6f'] * (len(columns) - 1)
+        
+        widths = []
+        for header, col, spec in zip(headers, columns, specs):
+            # ค่าที่หายไปแสดงเป็น NaN แบบ pandas จึงหาความกว้างจากค่าที่ไม่ใช่ NaN และเผื่อความยาวของ 'NaN'
+            missing = np.isnan(col)
+            cell_widths = [len('NaN')] if missing.any() else []
+            if not missing.all():
+                cell_widths += [len(f'{np.nanmin(col).item():{spec}}'), len(f'{np.nanmax(col).item():{spec}}')]
+            widths.append(max(len(header) + 1, *cell_widths))
+        header_line = ' '.join(header.rjust(w) for header, w in zip(headers, widths))
+        row_format = ' '.join(f'{{:>{w}{spec}}}' for w, spec in zip(widths, specs))
+        rows = [row_format.format(*row).replace('nan', 'NaN') for row in zip(*(col.tolist() for col in columns))]
+        return '\n'.join([header_line] + rows)
     
     def print_summary(self):
         """แสดงสรุปข้อมูล GDP"""
         print("\n" + "="*70)
         print("GDP SUMMARY / สรุปข้อมูล GDP".center(70))
         print("="*70)
-        print(f"\nช่วงเวลา: {self.data['Year'].min()} - {self.data['Year'].max()}")
-        print(f"\nGDP เฉลี่ย: {self.data['GDP'].mean():.2f} พันล้าน")
-        print(f"GDP สูงสุด: {self.data['GDP'].max():.2f} พันล้าน (ปี {self.data.loc[self.data['GDP'].idxmax(), 'Year']})")
-        print(f"GDP ต่ำสุด: {self.data['GDP'].min():.2f} พันล้าน (ปี {self.data.loc[self.data['GDP'].idxmin(), 'Year']})")
+        gdp = self._arr[:, GDP]
+        years = self._years
+        # ข้ามค่าที่หายไป (NaN) แบบเดียวกับ mean/max/idxmax ของ pandas
+        imax = np.nanargmax(gdp)
+        imin = np.nanargmin(gdp)
+        
+        print(f"\nช่วงเวลา: {years.min()} - {years.max()}")
+        # สะสมผลรวมเป็น float64 เฉพาะค่าสรุป เพื่อไม่ให้ความคลาดเคลื่อนของ float32 สะสมเมื่อมีหลายปี
+        print(f"\nGDP เฉลี่ย: {np.nanmean(gdp, dtype=np.float64):.2f} พันล้าน")
+        print(f"GDP สูงสุด: {gdp[imax]:.2f} พันล้าน (ปี {years[imax]})")
+        print(f"GDP ต่ำสุด: {gdp[imin]:.2f} พันล้าน (ปี {years[imin]})")
         
-        growth_rate = self.data['GDP'].pct_change() * 100
-        print(f"\nอัตราการเติบโตเฉลี่ย: {growth_rate[1:].mean():.2f}%")
-        print(f"อัตราการเติบโตสูงสุด: {growth_rate[1:].max():.2f}% (ปี {self.data.loc[growth_rate[1:].idxmax(), 'Year']})")
+        growth_rate = self._growth()
+        ipeak = 1 + np.nanargmax(growth_rate[1:])
+        print(f"\nอัตราการเติบโตเฉลี่ย: {np.nanmean(growth_rate[1:], dtype=np.float64):.2f}%")
+        print(f"อัตราการเติบโตสูงสุด: {growth_rate[ipeak]:.2f}% (ปี {years[ipeak]})")
         
         print("\n" + "-"*70)
         print("ข้อมูลรายปี:".center(70))
         print("-"*70)
-        print(self.data.to_string(index=False))
+        print(self._format_table())
         print("="*70 + "\n")
+    
+    def run(self, years=10, start_year=2015, mode='full'):
+        """รันโมเดลทั้งหมด โหมด 'compute' คำนวณและแสดงสรุปเท่านั้นโดยไม่สร้างกราฟ"""
+        if mode not in ('full', 'compute'):
+            raise ValueError(f"mode ต้องเป็น 'full' หรือ 'compute' (ได้รับ {mode!r})")
+        
+        print("\n📊 กำลังสร้างข้อมูลตัวอย่าง...")
+        self.generate_sample_data(years=years, start_year=start_year)
+        print("✓ สร้างข้อมูลเสร็จสิ้น")
+        
+        self.print_summary()
+        
+        if mode == 'full':
+            print("\n📈 กำลังสร้างกราฟ...")
+            print("-"*70)
+            
+            # กราฟแต่ละรูปไม่ขึ้นต่อกัน จึงแยกวาดพร้อมกันใน process ละรูป
+            records = self.data.to_records(index=False)
+            with ProcessPoolExecutor(max_workers=len(PLOT_JOBS)) as executor:
+                futures = [executor.submit(_render_one, kind, path, records, self.dpi)
+                           for kind, path, _ in PLOT_JOBS]
+                for (_, path, _), future in zip(PLOT_JOBS, futures):
+                    future.result()
+                    print(f"✓ บันทึกกราฟที่: {path}")
+
 
+# ชื่อกราฟที่ส่งให้ process ลูก -> เมธอดของ GDPModel ที่ใช้วาด
+_PLOT_METHODS = {
+    'trend': 'plot_gdp_trend',
+    'components': 'plot_gdp_components',
+    'growth': 'plot_growth_rate',
+    'all_components': 'plot_all_components_trends'
+}
 
-def main():
+# กราฟที่ GDPModel.run สร้างในโหมด 'full': (ชื่อกราฟ, ไฟล์, คำอธิบาย)
+PLOT_JOBS = [
+    ('trend', 'gdp_trend.png', 'กราฟแนวโน้ม GDP'),
+    ('components', 'gdp_components.png', 'กราฟองค์ประกอบของ GDP'),
+    ('growth', 'gdp_growth_rate.png', 'กราฟอัตราการเติบโต'),
+    ('all_components', 'all_components_trends.png', 'กราฟแนวโน้มทุกองค์ประกอบ')
+]
+
+
+def _render_one(kind, save_path, records, dpi):
+    """วาดกราฟหนึ่งรูปใน process แยก โดยสร้าง GDPModel ใหม่จากข้อมูลที่ส่งมาเป็น records"""
+    import matplotlib
+    matplotlib.use('Agg')
+    model = GDPModel(dpi=dpi)
+    model.data = pd.DataFrame.from_records(records)
+    # ปิดข้อความของ _render ใน process ลูก ให้ process หลักพิมพ์แทนตามลำดับที่แน่นอน
+    with contextlib.redirect_stdout(io.StringIO()):
+        getattr(model, _PLOT_METHODS[kind])(save_path)
+
+
+def main(argv=None):
     """ฟังก์ชันหลักสำหรับรันโมเดล GDP"""
+    parser = argparse.ArgumentParser(description='โมเดลสำหรับคำนวณและแสดงผล GDP')
+    parser.add_argument('--no-plots', action='store_true',
+                        help='คำนวณและแสดงสรุปเท่านั้น ไม่สร้างกราฟ (ไม่ต้องโหลด matplotlib)')
+    args = parser.parse_args(argv)
+    mode = 'compute' if args.no_plots else 'full'
+    
     print("\n🚀 เริ่มต้นโมเดล GDP Model")
     print("="*70)
     
     model = GDPModel()
+    model.run(years=10, start_year=2015, mode=mode)
     
-    print("\n📊 กำลังสร้างข้อมูลตัวอย่าง...")
-    data = model.generate_sample_data(years=10, start_year=2015)
-    print("✓ สร้างข้อมูลเสร็จสิ้น")
-    
-    model.print_summary()
-    
-    print("\n📈 กำลังสร้างกราฟ...")
-    print("-"*70)
-    
-    model.plot_gdp_trend('gdp_trend.png')
-    model.plot_gdp_components('gdp_components.png')
-    model.plot_growth_rate('gdp_growth_rate.png')
-    model.plot_all_components_trends('all_components_trends.png')
-    
-    print("\n" + "="*70)
-    print("✅ เสร็จสิ้นการสร้างกราฟทั้งหมด!")
-    print("="*70)
-    print("\nไฟล์ที่สร้าง:")
-    print("  1. gdp_trend.png - กราฟแนวโน้ม GDP")
-    print("  2. gdp_components.png - กราฟองค์ประกอบของ GDP")
-    print("  3. gdp_growth_rate.png - กราฟอัตราการเติบโต")
-    print("  4. all_components_trends.png - กราฟแนวโน้มทุกองค์ประกอบ")
-    print("\n")
+    if mode == 'full':
+        print("\n" + "="*70)
+        print("✅ เสร็จสิ้นการสร้างกราฟทั้งหมด!")
+        print("="*70)
+        print("\nไฟล์ที่สร้าง:")
+        for i, (_, path, description) in enumerate(PLOT_JOBS, start=1):
+            print(f"  {i}. {path} - {description}")
+        print("\n")
 
 
 if __name__ == "__main__":